@@ -0,0 +1,78 @@
+"""
+Merge the bus_data_splits CSV files into a single Parquet file.
+
+Run at deploy time (``python build_bus_parquet.py``, see .devcontainer/devcontainer.json);
+dashboard.py reads the resulting bus_data_splits.parquet instead of re-parsing every CSV
+on a cold cache. The bus column dtypes (and the matching Arrow schema) and the CSV file
+listing are defined here and shared with dashboard.py.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+INPUT_FOLDER = "bus_data_splits"
+
+# Column dtypes of the bus dataset; only these columns are used by the visualizations
+BUS_DTYPES = {
+    "year": "int16",
+    "origin_yishuv_nm": "category",
+    "destination_yishuv_nm": "category",
+    "lat_origin": "float32",
+    "lon_origin": "float32",
+    "lat_dest": "float32",
+    "lon_dest": "float32",
+    "trips_count": "int32",
+}
+
+# Arrow schema derived from BUS_DTYPES; dictionary-encoded strings become pandas categoricals
+BUS_SCHEMA = pa.schema([
+    (name, pa.dictionary(pa.int32(), pa.string()) if dtype == "category" else pa.from_numpy_dtype(np.dtype(dtype)))
+    for name, dtype in BUS_DTYPES.items()
+])
+
+
+def list_bus_csv_files(input_folder):
+    """
+    List the CSV files of a bus data folder, in a stable (sorted) order.
+
+    Args:
+        input_folder (str): Directory containing the CSV files.
+
+    Returns:
+        list: Paths of the CSV files.
+    """
+    return sorted(os.path.join(input_folder, f) for f in os.listdir(input_folder) if f.endswith('.csv'))
+
+
+def bus_parquet_path(input_folder):
+    """
+    Path of the Parquet file built from a bus data folder (e.g. "bus_data_splits.parquet").
+
+    Args:
+        input_folder (str): Directory containing the CSV files.
+
+    Returns:
+        str: Path of the Parquet file, next to the folder.
+    """
+    return os.path.normpath(input_folder) + ".parquet"
+
+
+def build_bus_parquet(input_folder=INPUT_FOLDER):
+    """
+    Merge all CSV files in a folder and write them to a zstd-compressed Parquet file.
+
+    Args:
+        input_folder (str): Directory containing the CSV files to merge.
+    """
+    all_files = list_bus_csv_files(input_folder)
+    # The index is not written to the Parquet file, so no fresh RangeIndex is needed
+    merged_df = pd.concat(
+        [pd.read_csv(file, dtype=BUS_DTYPES, usecols=list(BUS_DTYPES)) for file in all_files]
+    ).astype(BUS_DTYPES)
+    merged_df.to_parquet(bus_parquet_path(input_folder), engine="pyarrow", compression="zstd", index=False)
+
+
+if __name__ == "__main__":
+    build_bus_parquet()
@@ -1,9 +1,14 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import pydeck as pdk
+from build_bus_parquet import BUS_DTYPES, BUS_SCHEMA, bus_parquet_path, list_bus_csv_files
 import plotly.express as px
-import matplotlib.pyplot as plt
+import plotly.graph_objects as go
 import calendar
 
 # 1) ------------ CONFIGURE PAGE + WIDER SIDEBAR -------------
@@ -92,10 +97,27 @@ st.markdown(
 
 
 # 2) ------------- CACHING / LOAD DATA FUNCTIONS -------------
-@st.cache_data
+# The loaded DataFrames are cached as shared resources (no pickling on cache hits),
+# so they must be treated as read-only: filter/groupby into new frames instead.
+
+# Column dtypes of the train dataset
+TRAIN_DTYPES = {
+    "shana": "int16",
+    "hodesh": "int8",
+    "train_station_nm": "category",
+    "station_status_nm": "category",
+    "status_count": "int32",
+}
+
+
+@st.cache_resource
 def load_bus_data(folder_path="bus_data_splits"):
     """
-    Load and preprocess bus route data by merging all CSV files in the specified folder.
+    Load and preprocess bus route data.
+
+    Reads the Parquet file pre-built from the specified folder (see build_bus_parquet.py)
+    when it exists and is newer than every CSV file, and falls back to merging all CSV
+    files in the folder otherwise.
 
     Args:
         folder_path (str): Path to the folder containing CSV files. Default is "bus_data_splits".
@@ -113,92 +135,158 @@ def load_bus_data(folder_path="bus_data_splits"):
         Returns:
             pd.DataFrame: Combined DataFrame with all data from the smaller CSV files.
         """
-        all_files = [os.path.join(input_folder, f) for f in os.listdir(input_folder) if f.endswith('.csv')]
-        combined_data = []
-
-        for file in all_files:
-            df = pd.read_csv(file)
-            combined_data.append(df)
+        all_files = list_bus_csv_files(input_folder)
+        if not all_files:
+            return pd.DataFrame(columns=BUS_SCHEMA.names).astype(BUS_DTYPES)
 
-        merged_df = pd.concat(combined_data, ignore_index=True)
+        convert_options = pacsv.ConvertOptions(
+            column_types=BUS_SCHEMA,
+            include_columns=BUS_SCHEMA.names
+        )
+        # Parallelism comes from reading one file per thread, so each read runs single-threaded
+        # instead of also starting Arrow's own thread pool
+        read_options = pacsv.ReadOptions(use_threads=False)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(all_files))) as executor:
+            combined_data = list(executor.map(
+                lambda file: pacsv.read_csv(file, read_options=read_options, convert_options=convert_options),
+                all_files
+            ))
+
+        # Arrow concatenation only chains the chunks (no copy); dictionaries are unified on conversion
+        merged_df = pa.concat_tables(combined_data).to_pandas()
+
+        # The unified categories are in order of first appearance; sort them like the Parquet path
+        for column, dtype in BUS_DTYPES.items():
+            if dtype == "category":
+                merged_df[column] = merged_df[column].cat.reorder_categories(
+                    sorted(merged_df[column].cat.categories)
+                )
         return merged_df
 
+    # A Parquet file older than any of the CSV files is stale and is ignored
+    parquet_path = bus_parquet_path(folder_path)
+    csv_mtimes = [os.path.getmtime(file) for file in list_bus_csv_files(folder_path)]
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= max(csv_mtimes, default=0):
+        # Only the columns used by the visualizations are read (column pruning)
+        return pd.read_parquet(parquet_path, engine="pyarrow", columns=list(BUS_DTYPES))
+
     df = merge_csvs(folder_path)
     return df
 
-@st.cache_data
+@st.cache_resource
 def load_train_data(csv_path="timetable_train_database_preproccesed.csv"):
     """
     Load and preprocess train status data (also used for ridership analysis).
     """
-    df = pd.read_csv(csv_path)
+    df = pd.read_csv(csv_path, dtype=TRAIN_DTYPES, usecols=list(TRAIN_DTYPES))
     return df
 
+@st.cache_resource
+def load_train_monthly(csv_path="timetable_train_database_preproccesed.csv"):
+    """
+    Pre-aggregate train status counts per station, year and month (used for ridership analysis).
+    """
+    df = load_train_data(csv_path)
+    monthly_df = df.groupby(
+        ['train_station_nm', 'shana', 'hodesh'], as_index=False, observed=True
+    )['status_count'].sum()
+    return monthly_df
 
-# 3) ------------- VISUALIZATION #1: BUS ROUTES CONNECTIVITY -------------
-def show_bus_routes_connectivity():
+@st.cache_data
+def bus_years():
     """
-    Displays the bus routes connectivity map using pydeck.
+    Sorted tuple of the years available in the bus data (used by the year filter).
     """
-    # Research Question
-    st.markdown("<h1 style='color: #D2691E;'>Israel Bus Routes Visualization 🚌</h1>", unsafe_allow_html=True)
-    st.markdown(
-        "### What are the most connected cities in Israel, and is there a strong dependency on specific transportation hubs?"
-    )
+    df = load_bus_data("bus_data_splits")
+    return tuple(sorted(int(year) for year in df["year"].unique()))
 
-    # -- Hideable filters for bus routes
-    with st.expander("Filters (Bus Routes)", expanded=False):
-        # Load bus data once (cached)
-        df = load_bus_data("bus_data_splits")
+@st.cache_data
+def bus_origins(years):
+    """
+    Sorted tuple of the origin cities with bus routes in the given years (used by the origin filter).
+    """
+    df = load_bus_data("bus_data_splits")
+    return tuple(sorted(df.loc[df["year"].isin(years), "origin_yishuv_nm"].unique()))
 
-        selected_years = st.multiselect(
-            "Select Year(s):",
-            sorted(df["year"].unique()),
-            default=df["year"].unique()
-        )
-        if not selected_years:
-            st.warning("Please select at least one year.")
-            st.stop()
+@st.cache_data
+def train_years():
+    """
+    Sorted tuple of the years available in the train data (used by the year filter).
+    """
+    df = load_train_data("timetable_train_database_preproccesed.csv")
+    return tuple(sorted(int(year) for year in df['shana'].unique()))
+
+@st.cache_data
+def train_stations():
+    """
+    Tuple of the train station names, in order of appearance (used by the station filter).
+    """
+    df = load_train_data("timetable_train_database_preproccesed.csv")
+    return tuple(df['train_station_nm'].unique().tolist())
 
-        # Filter by selected years
-        df_filtered = df[df["year"].isin(selected_years)]
 
-        origin_cities = sorted(df_filtered["origin_yishuv_nm"].unique())
-        selected_origin = st.selectbox("Select Origin City:", origin_cities)
+# 3) ------------- VISUALIZATION #1: BUS ROUTES CONNECTIVITY -------------
+@st.cache_data
+def compute_top15(years, origin):
+    """
+    Compute the 15 busiest routes leaving an origin city in the selected years.
 
-    # Filter by chosen origin city
-    df_city = df_filtered[df_filtered["origin_yishuv_nm"] == selected_origin]
+    Args:
+        years (tuple): Sorted tuple of selected years (hashable cache key).
+        origin (str): Name of the origin city.
+
+    Returns:
+        pd.DataFrame: Top 15 routes by total trips_count.
+    """
+    df = load_bus_data("bus_data_splits")
+    df_city = df[df["year"].isin(years) & (df["origin_yishuv_nm"] == origin)]
+
+    # Nothing to group for this selection; build_deck and the page report it as no data
+    if df_city.empty:
+        return df_city
 
-    # Group the filtered city data
+    # Group the filtered city data by destination; the origin is constant after the filter,
+    # so it is attached back as scalar columns instead of being a groupby key
     df_city_grouped = (
         df_city.groupby(
-            [
-                "origin_yishuv_nm",
-                "destination_yishuv_nm",
-                "lat_origin",
-                "lon_origin",
-                "lat_dest",
-                "lon_dest",
-            ],
-            as_index=False
+            ["destination_yishuv_nm", "lat_dest", "lon_dest"],
+            as_index=False,
+            observed=True
         )["trips_count"].sum()
     )
+    df_city_grouped["origin_yishuv_nm"] = origin
+    df_city_grouped["lat_origin"] = df_city["lat_origin"].iat[0]
+    df_city_grouped["lon_origin"] = df_city["lon_origin"].iat[0]
 
     # Choose top 15 routes
-    df_top15 = df_city_grouped.nlargest(15, "trips_count")
+    return df_city_grouped.nlargest(15, "trips_count")
+
+
+@st.cache_resource
+def build_deck(years, origin):
+    """
+    Build the pydeck map of the top 15 routes and pre-render it to HTML.
+
+    Args:
+        years (tuple): Sorted tuple of selected years (hashable cache key).
+        origin (str): Name of the origin city.
+
+    Returns:
+        str | None: Standalone deck HTML, or None if there is no data for the selection.
+    """
+    df_top15 = compute_top15(years, origin)
 
     if df_top15.empty:
-        st.warning("No data available for this selection.")
-        return
+        return None
 
     # Normalize trips_count for arc width
-    df_top15["normalized_width"] = (
-            df_top15["trips_count"] / df_top15["trips_count"].max() * 6
-    )
+    trips = df_top15["trips_count"].to_numpy()
+    df_top15["normalized_width"] = (trips * (6.0 / trips.max())).astype(np.float32)
 
-    # Coordinates of the selected origin city
-    origin_lat = df_top15.iloc[0]["lat_origin"]
-    origin_lon = df_top15.iloc[0]["lon_origin"]
+    # Coordinates of the selected origin city (plain floats, float32 scalars serialize as strings)
+    origin_lat = float(df_top15.iloc[0]["lat_origin"])
+    origin_lon = float(df_top15.iloc[0]["lon_origin"])
 
     # Define the view state
     view_state = pdk.ViewState(
@@ -254,8 +342,50 @@ def show_bus_routes_connectivity():
         }
     )
 
-    # Make the chart bigger by specifying a height
-    st.pydeck_chart(deck, use_container_width=True)
+    return deck.to_html(as_string=True, notebook_display=False)
+
+
+def show_bus_routes_connectivity():
+    """
+    Displays the bus routes connectivity map using pydeck.
+    """
+    # Research Question
+    st.markdown("<h1 style='color: #D2691E;'>Israel Bus Routes Visualization 🚌</h1>", unsafe_allow_html=True)
+    st.markdown(
+        "### What are the most connected cities in Israel, and is there a strong dependency on specific transportation hubs?"
+    )
+
+    # -- Hideable filters for bus routes
+    with st.expander("Filters (Bus Routes)", expanded=False):
+        # Available years are computed once from the bus data (cached)
+        selected_years = st.multiselect(
+            "Select Year(s):",
+            bus_years(),
+            default=bus_years()
+        )
+        if not selected_years:
+            st.warning("Please select at least one year.")
+            st.stop()
+
+        # Origin cities with routes in the selected years (cached per selection)
+        origin_cities = bus_origins(tuple(sorted(selected_years)))
+        selected_origin = st.selectbox("Select Origin City:", origin_cities)
+
+    # Pre-rendered deck for the selection (cached per selection)
+    deck_html = build_deck(tuple(sorted(selected_years)), selected_origin)
+
+    if deck_html is None:
+        st.warning("No data available for this selection.")
+        return
+
+    # Render the deck as standalone HTML so Streamlit does not re-serialize it through the pydeck bridge
+    # (make the chart bigger by specifying a height). st.components.v1.html is deprecated in favor of
+    # st.iframe, so it is only used (and imported) on Streamlit versions without st.iframe
+    if hasattr(st, "iframe"):
+        st.iframe(deck_html, height=700)
+    else:
+        import streamlit.components.v1 as components
+        components.html(deck_html, height=700, scrolling=False)
 
     # -- Key Insights Section (under the graph) --
     st.markdown("<h2 style='color: #9ACD32;'>Key Insights for the Bus Routes Connectivity</h2>", unsafe_allow_html=True)
@@ -275,6 +405,47 @@ def show_bus_routes_connectivity():
 
 
 # 4) ------------- VISUALIZATION #2: TRAIN STATUS ANALYSIS -------------
+@st.cache_data
+def top_stations_for_year(year, n=15):
+    """
+    Find the most popular train stations (by total status count) in a given year.
+
+    Args:
+        year (int): Year to rank the stations in.
+        n (int): Number of stations to return. Default is 15.
+
+    Returns:
+        list: Station names, most popular first.
+    """
+    df = load_train_data("timetable_train_database_preproccesed.csv")
+    return (
+        df.loc[df['shana'] == year]
+        .groupby('train_station_nm', observed=True)['status_count']
+        .sum()
+        .nlargest(n)
+        .index
+        .tolist()
+    )
+
+
+@st.cache_data
+def station_options_sorted():
+    """
+    List all train stations, most popular (by total status count) first.
+
+    Returns:
+        list: Station names sorted by total status count in descending order.
+    """
+    df = load_train_data("timetable_train_database_preproccesed.csv")
+    return (
+        df.groupby('train_station_nm', observed=True)['status_count']
+        .sum()
+        .sort_values(ascending=False)
+        .index
+        .tolist()
+    )
+
+
 def show_train_status_analysis():
     """
     Displays the train status stacked bar chart using Plotly.
@@ -290,26 +461,16 @@ def show_train_status_analysis():
         df = load_train_data("timetable_train_database_preproccesed.csv")
 
         # Determine top 15 most popular stations in 2024 (if 2024 data exists)
-        if 2024 in df['shana'].unique():
-            top_stations_2024 = (
-                df[df['shana'] == 2024]
-                .groupby('train_station_nm')['status_count']
-                .sum()
-                .nlargest(15)
-                .index
-                .tolist()
-            )
+        available_years = train_years()
+        if 2024 in available_years:
+            top_stations_2024 = top_stations_for_year(2024)
             default_year_filter = 2024
         else:
             top_stations_2024 = []
-            default_year_filter = df['shana'].min()  # fallback
+            default_year_filter = available_years[0]  # fallback
 
         # Select year
-        available_years = sorted(df['shana'].unique())
-        if default_year_filter in available_years:
-            default_idx = available_years.index(default_year_filter)
-        else:
-            default_idx = 0
+        default_idx = available_years.index(default_year_filter)
 
         year_filter = st.selectbox(
             "Select Year:",
@@ -327,10 +488,9 @@ def show_train_status_analysis():
         )
 
         # Limit the number of stations selectable to 20
-        station_counts = df.groupby('train_station_nm')['status_count'].sum().sort_values(ascending=False)
         station_filter = st.multiselect(
             "Select Station Name (up to 20):",
-            options=station_counts.index.tolist(),
+            options=station_options_sorted(),
             default=top_stations_2024
         )
 
@@ -361,7 +521,7 @@ def show_train_status_analysis():
         }
 
         grouped_data = filtered_df.groupby(
-            ['train_station_nm', 'station_status_nm'], as_index=False
+            ['train_station_nm', 'station_status_nm'], as_index=False, observed=True
         )['status_count'].sum()
 
         stacked_bar_chart = px.bar(
@@ -401,6 +561,118 @@ def show_train_status_analysis():
 
 
 # 5) ------------- VISUALIZATION #3: TRAIN RIDERSHIP (LINE CHART) -------------
+@st.cache_data
+def build_ridership_figure(selected_city, year_range):
+    """
+    Build the monthly ridership line chart with event annotations using Plotly.
+
+    Args:
+        selected_city (str): Train station name, or "All" for every station.
+        year_range (tuple): (start year, end year) of the data to include.
+
+    Returns:
+        go.Figure: Line chart of the total trips per month.
+    """
+    data = load_train_monthly("timetable_train_database_preproccesed.csv")
+
+    # Filter out rows with dates later than September 2024, then by city and chosen year range
+    filtered_data = data[
+        ((data['shana'] < 2024) | ((data['shana'] == 2024) & (data['hodesh'] <= 9))) &
+        data['shana'].between(*year_range) &
+        ((selected_city == "All") | (data['train_station_nm'] == selected_city))
+        ]
+
+    # Calculate total trips per month
+    trips_per_month = filtered_data.groupby(['shana', 'hodesh'], observed=True)['status_count'].sum().reset_index()
+
+    # Combine year and month into an integer key for sorting/lookups and a timestamp for plotting
+    trips_per_month['ym_key'] = (
+            trips_per_month['shana'].to_numpy().astype(np.int32) * 12 +
+            trips_per_month['hodesh'].to_numpy().astype(np.int32) - 1
+    )
+    trips_per_month = trips_per_month.sort_values(by='ym_key', ignore_index=True)
+    trips_per_month['month_start'] = pd.to_datetime(
+        {'year': trips_per_month['shana'], 'month': trips_per_month['hodesh'], 'day': 1}
+    )
+
+    # Event annotations to highlight on the chart (offsets in pixels, positive y is up)
+    annotation_mapping = {
+        "Corona (2020-03)": {
+            "date": (2020, 3), "text": "Corona", "color": "#FF5733", "offset": (-30, -40)
+        },
+        "Corona 2 (2020-12)": {
+            "date": (2020, 12), "text": "Corona 2", "color": "#FF5733", "offset": (-30, -40)
+        },
+        "War (2023-10)": {
+            "date": (2023, 10), "text": "War", "color": "#B3B3B3", "offset": (-30, 20)
+        },
+        "Repair Work (2024-05)": {
+            "date": (2024, 5), "text": "Repair Work", "color": "#FFD700", "offset": (10, 20)
+        }
+    }
+
+    # Dynamic Hebrew title (rendered right-to-left by the browser)
+    city_text = "מכל הערים" if selected_city == "All" else selected_city
+
+    start_yr, end_yr = year_range
+    if start_yr == end_yr:
+        year_text = str(start_yr)
+    else:
+        year_text = f"{start_yr}-{end_yr}"
+
+    hebrew_title = f"נסיעות חודשיות מתחנת {city_text} החל משנת {year_text}"
+
+    # Plot line
+    fig = go.Figure()
+    fig.add_scatter(
+        x=trips_per_month['month_start'],
+        y=trips_per_month['status_count'],
+        mode='lines+markers',
+        line=dict(width=2, color='#3498DB'),  # Bright blue line
+        marker=dict(color='#78C679'),  # Vibrant green markers
+        name='Trips'
+    )
+
+    # Event Annotations (row positions are looked up by month key instead of scanning per event)
+    idx_by_key = {ym_key: i for i, ym_key in enumerate(trips_per_month['ym_key'].to_numpy())}
+    for event, ann in annotation_mapping.items():
+        year, month = ann["date"]
+        x_idx = idx_by_key.get(year * 12 + month - 1)
+        if x_idx is not None:
+            x_value = trips_per_month['month_start'].iat[x_idx]
+            y_value = trips_per_month['status_count'].iat[x_idx]
+            fig.add_annotation(
+                x=x_value,
+                y=y_value,
+                text=f"<b>{ann['text']}</b>",
+                ax=ann["offset"][0],
+                ay=-ann["offset"][1],
+                arrowcolor=ann["color"],
+                font=dict(size=14, color=ann["color"])
+            )
+            fig.add_scatter(
+                x=[x_value],
+                y=[y_value],
+                mode='markers',
+                marker=dict(color=ann["color"], size=14),
+                name=event,
+                showlegend=False
+            )
+
+    # Chart labeling
+    fig.update_layout(
+        title=dict(text=hebrew_title, font=dict(size=20, color='white')),
+        xaxis=dict(title='Year-Month', tickformat='%Y-%m', dtick='M6', gridcolor='gray', griddash='dash'),
+        yaxis=dict(title='Number of Trips', gridcolor='gray', griddash='dash'),
+        paper_bgcolor='#2E2E2E',  # Dark gray background
+        plot_bgcolor='#1E1E1E',  # Slightly darker for plot area
+        font=dict(size=12, color='white'),
+        showlegend=False,
+        height=600
+    )
+    return fig
+
+
 def show_train_ridership_events():
     """
     Displays how significant events in recent years affected train ridership across Israel.
@@ -414,20 +686,10 @@ def show_train_ridership_events():
 
     # -- Hideable filters and event annotations
     with st.expander("Filters (Train Ridership)", expanded=False):
-        # Load the same train data (cached)
-        data = load_train_data("timetable_train_database_preproccesed.csv")
-
-     
-        # Filter out rows with dates later than September 2024
-        data = data[
-            (data['shana'] < 2024) |
-            ((data['shana'] == 2024) & (data['hodesh'] <= 9))
-        ]
-        
         # 1. City Filter (default to שדרות, if it exists; otherwise 'All')
-        station_options = ["All"] + data['train_station_nm'].unique().tolist()
+        station_options = ["All"] + list(train_stations())
         default_city_index = 0
-        if 'שדרות' in data['train_station_nm'].unique():
+        if 'שדרות' in station_options:
             default_city_index = station_options.index('שדרות')
         selected_city = st.selectbox(
             "Select Train Station",
@@ -462,118 +724,9 @@ def show_train_ridership_events():
 """
     )
 
-    # Filter data by city
-    if selected_city != "All":
-        filtered_data = data[data['train_station_nm'] == selected_city].copy()
-    else:
-        filtered_data = data.copy()
-
-    # Filter by chosen year range
-    filtered_data = filtered_data[
-        (filtered_data['shana'] >= year_range[0]) &
-        (filtered_data['shana'] <= year_range[1])
-        ]
-
-    # Calculate total trips per month
-    trips_per_month = filtered_data.groupby(['shana', 'hodesh'])['status_count'].sum().reset_index()
-
-    # Combine year and month for plotting
-    trips_per_month['year_month'] = (
-            trips_per_month['shana'].astype(str) +
-            '-' +
-            trips_per_month['hodesh'].astype(str).str.zfill(2)
-    )
-    trips_per_month = trips_per_month.sort_values(by=['shana', 'hodesh']).reset_index(drop=True)
-
-    # Event annotations to highlight on the chart
-    annotation_mapping = {
-        "Corona (2020-03)": {
-            "date": "2020-03", "text": "Corona", "color": "#FF5733", "offset": (-30, -40)
-        },
-        "Corona 2 (2020-12)": {
-            "date": "2020-12", "text": "Corona 2", "color": "#FF5733", "offset": (-30, -40)
-        },
-        "War (2023-10)": {
-            "date": "2023-10", "text": "War", "color": "#B3B3B3", "offset": (-30, 20)
-        },
-        "Repair Work (2024-05)": {
-            "date": "2024-05", "text": "Repair Work", "color": "#FFD700", "offset": (10, 20)
-        }
-    }
-
-    # Utility function for reversing Hebrew text (for demonstration)
-    def reverse_hebrew_text(text):
-        return ''.join(reversed(text))
-
-    # Dynamic Hebrew title (optional)
-    if selected_city == "All":
-        city_text = reverse_hebrew_text("מכל הערים")
-    else:
-        city_text = reverse_hebrew_text(selected_city)
-
-    start_yr, end_yr = year_range
-    if start_yr == end_yr:
-        year_text = str(start_yr)
-    else:
-        year_text = f"{start_yr}-{end_yr}"
-
-    hebrew_title = (
-            f"{year_text} " +
-            reverse_hebrew_text("החל משנת") +
-            f" {city_text} " +
-            reverse_hebrew_text("נסיעות חודשיות מתחנת")
-    )
-
-    # Plot using matplotlib
-    fig, ax = plt.subplots(figsize=(14, 7))
-    fig.patch.set_facecolor('#2E2E2E')  # Dark gray background
-    ax.set_facecolor('#1E1E1E')  # Slightly darker for plot area
-
-    # Plot line
-    ax.plot(
-        trips_per_month['year_month'],
-        trips_per_month['status_count'],
-        marker='o',
-        linestyle='-',
-        linewidth=2,
-        color='#3498DB',  # Bright blue line
-        markerfacecolor='#78C679'  # Vibrant green markers
-    )
-
-    # Event Annotations
-    for event, ann in annotation_mapping.items():
-        date = ann["date"]
-        if date in trips_per_month['year_month'].values:
-            x_idx = trips_per_month[trips_per_month['year_month'] == date].index[0]
-            y_value = trips_per_month.loc[x_idx, 'status_count']
-            ax.annotate(
-                ann["text"],
-                (x_idx, y_value),
-                textcoords="offset points",
-                xytext=ann["offset"],
-                ha='center',
-                fontsize=14,
-                fontweight='bold',
-                color=ann["color"]
-            )
-            ax.scatter(x_idx, y_value, color=ann["color"], s=150, zorder=5)
-
-    # Chart labeling
-    ax.set_title(hebrew_title, fontsize=20, fontweight='bold', color='white')
-    ax.set_xlabel('Year-Month', fontsize=16, color='white')
-    ax.set_ylabel('Number of Trips', fontsize=16, color='white')
-    ax.grid(color='gray', linestyle='--', linewidth=0.5, alpha=0.5)
-    ax.tick_params(axis='y', colors='white')
-    ax.tick_params(axis='x', colors='white')
-
-    # Thin out the x-tick labels for readability
-    x_labels = trips_per_month['year_month'].unique()
-    reduced_labels = [x_labels[i] if i % 6 == 0 else '' for i in range(len(x_labels))]
-    ax.set_xticks(range(len(x_labels)))
-    ax.set_xticklabels(reduced_labels, rotation=45, fontsize=12, color='white')
-
-    plt.tight_layout()
-    st.pyplot(fig)
+    # Line chart with event annotations (cached per selection)
+    fig = build_ridership_figure(selected_city, year_range)
+    st.plotly_chart(fig)
 
     # -- Key Insights Section (under the chart) --
     st.markdown("<h2 style='color: #CD853F;'>Key Insights for Train Ridership Over Time</h2>", unsafe_allow_html=True)